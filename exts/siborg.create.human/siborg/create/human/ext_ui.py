@@ -242,6 +242,9 @@ class SliderEntryPanelModel:
         """
         for param in self.changed_params:
             param.fn(param.value.get_value_as_float())
+        if self.changed_params:
+            # Invalidate cached mesh data
+            MHCaller.mark_modified()
         # Clear the list of changed parameters
         self.changed_params = []
 
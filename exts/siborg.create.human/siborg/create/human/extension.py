@@ -10,6 +10,7 @@ from pxr import Usd
 from typing import Union
 
 from .window import MHWindow, WINDOW_TITLE, MENU_PATH
+from .human import shutdown_executor
 
 class MakeHumanExtension(omni.ext.IExt):
     # ext_id is current extension id. It can be used with extension manager to query additional information, like where
@@ -54,6 +55,9 @@ class MakeHumanExtension(omni.ext.IExt):
         # Deregister the function that shows the window from omni.ui
         ui.Workspace.set_show_window_fn(WINDOW_TITLE, None)
 
+        # Release the worker threads used to build mesh arrays
+        shutdown_executor()
+
     async def _destroy_window_async(self):
         # wait one frame, this is due to the one frame defer
         # in Window::_moveToMainOSWindow()
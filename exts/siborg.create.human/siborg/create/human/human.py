@@ -1,16 +1,117 @@
 from typing import Tuple, List, Dict, Union
 from .mhcaller import MHCaller
 import numpy as np
+import os
+from concurrent.futures import ThreadPoolExecutor
 import omni.kit
 import omni.usd
 from pxr import Sdf, Usd, UsdGeom, UsdSkel
-from .shared import sanitize, data_path
+from .shared import sanitize, data_path, MeshSoA
 from .skeleton import Skeleton
 from module3d import Object3D
 from pxr import Usd, UsdGeom, UsdPhysics, UsdShade, Sdf, Gf, Tf, UsdSkel, Vt
 import carb
+import carb.settings
 
 from .materials import get_mesh_texture, create_material, bind_material
+
+
+def prune_faces(fvert: np.ndarray, fuvs: np.ndarray, face_mask: np.ndarray, nPerFace: int):
+    """Removes masked faces from a makehuman mesh and flattens the vertex and UV indices of
+    the remaining faces. Only the first <nPerFace> indices of each face are kept, ordered
+    consecutively.
+
+    Makehuman stores faces as fixed-width rows (triangles repeat their last vertex), so
+    this is done with a boolean row selection rather than a loop over faces.
+
+    Parameters
+    ----------
+    fvert : np.ndarray
+        Vertex indices of each face, shape (nFaces, verts per face)
+    fuvs : np.ndarray
+        UV indices of each face, shape (nFaces, verts per face)
+    face_mask : np.ndarray
+        Boolean array, True for each face to keep
+    nPerFace : int
+        Number of vertices per face to keep
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray, int]
+        Flat int32 arrays of vertex indices and UV indices, and the number of faces kept
+    """
+    # Views of the first <nPerFace> indices of each face. No data is copied yet
+    fv = np.asarray(fvert)[:, :nPerFace]
+    # build an array of (u,v) indices for each face
+    fuv = np.asarray(fuvs)[:, :nPerFace]
+
+    mask = np.asarray(face_mask, dtype=bool)
+    n_active = int(np.count_nonzero(mask))
+    if n_active != len(mask):
+        fv = fv[mask]
+        fuv = fuv[mask]
+
+    # Copy into flat contiguous int32 arrays. If no faces are masked this is the only
+    # copy made, otherwise it only copies when the dtype differs
+    newvertindices = np.ascontiguousarray(fv, dtype=np.int32).ravel()
+    newuvindices = np.ascontiguousarray(fuv, dtype=np.int32).ravel()
+    return newvertindices, newuvindices, n_active
+
+
+# A mesh prim (under "prim") and its attributes, keyed by attribute name
+MeshAttributes = Dict[str, Union[Usd.Prim, Usd.Attribute]]
+
+# Thread pool used to build mesh arrays. Created on first use and shared by all humans
+_executor = None
+
+
+def _get_executor():
+    """Returns the shared thread pool used to build mesh arrays, creating it if needed"""
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=os.cpu_count())
+    return _executor
+
+
+def shutdown_executor():
+    """Shuts down the shared thread pool, if it was created. Called when the extension shuts down
+    so that its worker threads don't outlive a reload"""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False)
+        _executor = None
+
+
+# Vt array types for attribute types stored at half precision
+_HALF_ARRAY_TYPES = {
+    Sdf.ValueTypeNames.TexCoord2hArray: Vt.Vec2hArray,
+    Sdf.ValueTypeNames.Normal3hArray: Vt.Vec3hArray,
+}
+
+
+def vt_vec_array(array: np.ndarray, type_name: Sdf.ValueTypeName):
+    """Wraps an array of 2D or 3D float32 vectors in the Vt array type held by attributes
+    of the given type, converting to half precision if the attribute stores halves.
+
+    Parameters
+    ----------
+    array : np.ndarray
+        Array of vectors, shape (n, 2) or (n, 3)
+    type_name : Sdf.ValueTypeName
+        Value type of the attribute the array will be written to
+
+    Returns
+    -------
+    Vt.Vec2fArray, Vt.Vec3fArray, Vt.Vec2hArray or Vt.Vec3hArray
+        USD array holding the vectors
+    """
+    half_type = _HALF_ARRAY_TYPES.get(type_name)
+    if half_type is not None:
+        return half_type.FromNumpy(array.astype(np.float16))
+    vt_type = Vt.Vec2fArray if array.shape[1] == 2 else Vt.Vec3fArray
+    return vt_type.FromNumpy(array)
+
+
 class Human:
     """Class representing a human in the scene. This class is used to add a human to the scene,
     and to update the human in the scene. The class also contains functions to add and remove
@@ -35,6 +136,10 @@ class Human:
     mh_meshes : List[Object3D]
         List of meshes attached to the human. Fetched from the makehuman app
         """
+
+    # Attributes of mesh prims which are written when the human is updated
+    _MESH_ATTRIBUTES = ("points", "normals", "faceVertexCounts", "faceVertexIndices")
+
     def __init__(self, name='human', **kwargs):
         """Constructs an instance of Human.
 
@@ -58,6 +163,26 @@ class Human:
         # usd_skel is none until the human is added to the stage
         self.usd_skel = None
 
+        # Caches of mesh data fetched from makehuman, keyed by id(mesh). Each entry
+        # holds ((mesh_version, topology_version, vertex count), array)
+        self._coords_cache = {}
+        self._normals_cache = {}
+
+        # Output buffers reused across imports, keyed by id(mesh) and then by array name
+        self._buffers = {}
+
+        # Topology version last imported under each human prim path
+        self._topology_versions = {}
+
+        # Sdf paths of the mesh prims last imported under each human prim path
+        self._path_cache = {}
+
+        # Mesh version of the normals last written to each mesh prim path
+        self._normals_versions = {}
+
+        # Mesh prims and their attributes, keyed by mesh prim path
+        self._prim_attr_cache = {}
+
         # Set the human in makehuman to default values
         MHCaller.reset_human()
 
@@ -255,132 +380,416 @@ class Human:
         # Get the meshes of the human and its proxies
         meshes = [o.mesh for o in objects]
 
-        usd_mesh_paths = []
-
-        for mesh in meshes:
-            # Number of vertices per face
-            nPerFace = mesh.vertsPerFaceForExport
-            # Lists to hold pruned lists of vertex and UV indices
-            newvertindices = []
-            newuvindices = []
-
-            # Array of coordinates organized [[x1,y1,z1],[x2,y2,z2]...]
-            # Adding the given offset moves the mesh relative to the prim origin
-            coords = mesh.getCoords() + offset
-            for fn, fv in enumerate(mesh.fvert):
-                if not mesh.face_mask[fn]:
-                    continue
-                # only include <nPerFace> verts for each face, and order them
-                # consecutively
-                newvertindices += [(fv[n]) for n in range(nPerFace)]
-                fuv = mesh.fuvs[fn]
-                # build an array of (u,v)s for each face
-                newuvindices += [(fuv[n]) for n in range(nPerFace)]
-
-            # Type conversion
-            newvertindices = np.array(newvertindices)
-
-            # Create mesh prim at appropriate path. Does not yet hold any data
-            name = sanitize(mesh.name)
-            usd_mesh_path = prim_path + "/" + name
-            usd_mesh_paths.append(usd_mesh_path)
-            # Check to see if the mesh prim already exists
-            prim = stage.GetPrimAtPath(usd_mesh_path)
-
-            if prim.IsValid():
-                # omni.kit.commands.execute("DeletePrims", paths=[usd_mesh_path])
-                point_attr = prim.GetAttribute('points')
-                point_attr.Set(coords)
-
-                face_count = prim.GetAttribute('faceVertexCounts')
-                nface = [nPerFace] * int(len(newvertindices) / nPerFace)
-                face_count.Set(nface)
-
-                face_idx = prim.GetAttribute('faceVertexIndices')
-                face_idx.Set(newvertindices)
-
-                normals_attr = prim.GetAttribute('normals')
-                normals_attr.Set(mesh.getNormals())
-
-                meshGeom = UsdGeom.Mesh(prim)
-
-            # If it doesn't exist, make it. This will run the first time a human is created and
-            # whenever a new proxy is added
+        # Mesh prim paths, one for each mesh
+        usd_mesh_paths = [prim_path + "/" + sanitize(mesh.name) for mesh in meshes]
+
+        # Check to see if the mesh prims already exist, and get their attributes if so
+        mesh_attrs = [self._get_mesh_attributes(stage, usd_mesh_path) for usd_mesh_path in usd_mesh_paths]
+
+        # Faces and UVs only change when proxies are added or removed, so they only need
+        # to be rewritten if the topology has changed since this human was last imported,
+        # or if the mesh prim has not been created yet
+        topology_dirty = self._topology_dirty(prim_path)
+
+        if topology_dirty:
+            # Drop cached data for meshes which are no longer attached to the human
+            mesh_ids = set(id(mesh) for mesh in meshes)
+            for cache in (self._coords_cache, self._normals_cache, self._buffers):
+                for key in [key for key in cache if key not in mesh_ids]:
+                    del cache[key]
+        with_faces = [topology_dirty or attrs is None for attrs in mesh_attrs]
+
+        # Normals only change with the shape of the human, so they don't need to be
+        # rewritten if only proxies have changed since they were last written
+        with_normals = [
+            attrs is None or self._normals_versions.get(usd_mesh_path) != MHCaller.mesh_version
+            for usd_mesh_path, attrs in zip(usd_mesh_paths, mesh_attrs)
+        ]
+
+        # Build the arrays for each mesh. This only involves makehuman and numpy, so meshes
+        # which need faces pruned are built in parallel when there are several of them. Updates
+        # of points and normals alone are built on the calling thread
+        if sum(with_faces) > 1:
+            executor = _get_executor()
+            futures = [
+                executor.submit(self._prepare_mesh_arrays, mesh, offset, True, normals) if faces else None
+                for mesh, faces, normals in zip(meshes, with_faces, with_normals)
+            ]
+        else:
+            futures = [None] * len(meshes)
+        mesh_arrays = [
+            future.result() if future else self._prepare_mesh_arrays(mesh, offset, faces, normals)
+            for mesh, future, faces, normals in zip(meshes, futures, with_faces, with_normals)
+        ]
+
+        # Values to set on attributes which already exist, as (attribute, value) pairs.
+        # These are written together at the end so that listeners are only notified once
+        pending = []
+
+        # UVs and normals of new mesh prims can optionally be stored at half precision
+        half_precision = bool(carb.settings.get_settings().get("/exts/siborg.create.human/half_precision"))
+
+        # Writing to the stage must happen serially
+        for mesh, usd_mesh_path, attrs, arrays in zip(meshes, usd_mesh_paths, mesh_attrs, mesh_arrays):
+            pending += self._write_mesh_prim(stage, usd_mesh_path, attrs, mesh, arrays, half_precision)
+
+        # Batch all value writes into a single change notification. Prims are defined
+        # above, outside of the block, since the Usd API cannot be used to create prims
+        # while a change block is open
+        with Sdf.ChangeBlock():
+            for attr, value in pending:
+                attr.Set(value)
+
+        # Faces and normals of every mesh are now up to date
+        self._topology_versions[prim_path] = MHCaller.topology_version
+        for usd_mesh_path in usd_mesh_paths:
+            self._normals_versions[usd_mesh_path] = MHCaller.mesh_version
+
+        # Convert path strings to USD Sdf paths. The meshes only change along with the
+        # topology, so the paths from the last import can be reused otherwise
+        if topology_dirty or prim_path not in self._path_cache:
+            self._path_cache[prim_path] = [Sdf.Path(mesh_path) for mesh_path in usd_mesh_paths]
+        paths = self._path_cache[prim_path]
+
+        return paths
+
+    def _prepare_mesh_arrays(self, mesh: Object3D, offset: List[float], with_faces: bool = True, with_normals: bool = True):
+        """Builds the arrays needed to represent a makehuman mesh in USD. Does not touch
+        the stage, so may be run in parallel for several meshes.
+
+        Parameters
+        ----------
+        mesh : Object3D
+            Makehuman mesh
+        offset : List[float]
+            Offset to move the mesh relative to the prim origin
+        with_faces : bool, optional
+            Whether to also build face and UV arrays, by default True
+        with_normals : bool, optional
+            Whether to also build the normals array, by default True
+
+        Returns
+        -------
+        MeshSoA
+            Points, as well as normals if `with_normals` is set, and faces and UVs if
+            `with_faces` is set
+        """
+        # Array of coordinates organized [[x1,y1,z1],[x2,y2,z2]...]
+        # Adding the given offset moves the mesh relative to the prim origin
+        coords = self._get_coords(mesh)
+        arrays = MeshSoA(np.add(coords, offset, out=self._get_buffer(mesh, "points", coords.shape)))
+
+        if with_normals:
+            normals = self._get_normals(mesh)
+            if normals.dtype != np.float32 or not normals.flags.c_contiguous:
+                # Only copy the normals if USD can't take them as they are
+                buf = self._get_buffer(mesh, "normals", normals.shape)
+                np.copyto(buf, normals, casting="same_kind")
+                normals = buf
+            arrays.normals = normals
+
+        if not with_faces:
+            return arrays
+
+        # Number of vertices per face
+        nPerFace = mesh.vertsPerFaceForExport
+
+        # Prune masked faces and get flat arrays of vertex and UV indices
+        newvertindices, newuvindices, n_active = prune_faces(mesh.fvert, mesh.fuvs, mesh.face_mask, nPerFace)
+
+        arrays.face_vert_idx = newvertindices
+        # Number of vertices in each remaining face
+        arrays.face_counts = np.full(n_active, nPerFace, dtype=np.int32)
+
+        texco = getattr(mesh, "texco", None)
+        if texco is not None:
+            # Reference the table directly rather than going through makehuman
+            arrays.uv_table = np.ascontiguousarray(texco, dtype=np.float32)
+            arrays.face_uv_idx = newuvindices
+        else:
+            arrays.uv_table = np.ascontiguousarray(mesh.getUVs(newuvindices), dtype=np.float32)
+            arrays.face_uv_idx = np.arange(len(newuvindices), dtype=np.int32)
+
+        return arrays
+
+    def _get_buffer(self, mesh: Object3D, name: str, shape: Tuple[int, ...]):
+        """Gets a float32 output buffer for a mesh, reusing the buffer from the previous
+        import if it has the same shape. Values are copied when wrapped in Vt arrays, so
+        buffers can safely be overwritten on the next import.
+
+        Parameters
+        ----------
+        mesh : Object3D
+            Makehuman mesh the buffer belongs to
+        name : str
+            Name of the buffer
+        shape : Tuple[int, ...]
+            Shape of the buffer
+
+        Returns
+        -------
+        np.ndarray
+            Uninitialized float32 array of the given shape
+        """
+        buffers = self._buffers.setdefault(id(mesh), {})
+        buf = buffers.get(name)
+        if buf is None or buf.shape != shape:
+            buf = np.empty(shape, dtype=np.float32)
+            buffers[name] = buf
+        return buf
+
+    def _get_mesh_attributes(self, stage: Usd.Stage, usd_mesh_path: str) -> Union[MeshAttributes, None]:
+        """Gets the prim and mesh attributes at the given path, reusing the handles from
+        the last import if they are still valid.
+
+        Parameters
+        ----------
+        stage : Usd.Stage
+            Stage containing the mesh prim
+        usd_mesh_path : str
+            Path to the mesh prim
+
+        Returns
+        -------
+        Union[MeshAttributes, None]
+            The prim (under "prim") and its attributes, keyed by attribute name, or None if
+            the prim doesn't exist
+        """
+        attrs = self._prim_attr_cache.get(usd_mesh_path)
+        # Handles expire when the prim is deleted or the stage is closed
+        if attrs is not None and attrs["prim"].IsValid() and attrs["prim"].GetStage() == stage:
+            return attrs
+
+        prim = stage.GetPrimAtPath(usd_mesh_path)
+        if not prim.IsValid():
+            self._prim_attr_cache.pop(usd_mesh_path, None)
+            return None
+
+        attrs = {name: prim.GetAttribute(name) for name in Human._MESH_ATTRIBUTES}
+        # Normals stored at half precision are written to the normals primvar instead,
+        # which takes precedence over the normals attribute
+        primvar_normals = prim.GetAttribute("primvars:normals")
+        if primvar_normals.IsValid():
+            attrs["normals"] = primvar_normals
+        attrs["prim"] = prim
+        self._prim_attr_cache[usd_mesh_path] = attrs
+        return attrs
+
+    def _write_mesh_prim(
+        self,
+        stage: Usd.Stage,
+        usd_mesh_path: str,
+        attrs: Union[MeshAttributes, None],
+        mesh: Object3D,
+        arrays: MeshSoA,
+        half_precision: bool = False,
+    ):
+        """Writes mesh arrays to a mesh prim, creating the prim if it doesn't exist. Values
+        for attributes which already exist are returned rather than written, so that they
+        can be set together.
+
+        Parameters
+        ----------
+        stage : Usd.Stage
+            Stage to write to
+        usd_mesh_path : str
+            Path to the mesh prim
+        attrs : Union[MeshAttributes, None]
+            The mesh prim at `usd_mesh_path` and its attributes, as returned by
+            `_get_mesh_attributes`. None if the prim doesn't exist yet
+        mesh : Object3D
+            Makehuman mesh the arrays were built from
+        arrays : MeshSoA
+            Arrays built by `_prepare_mesh_arrays`
+        half_precision : bool, optional
+            Whether to store UVs and normals at half precision if the prim is created,
+            by default False. Existing prims keep the precision they were created with
+
+        Returns
+        -------
+        List[Tuple[Usd.Attribute, object]]
+            Pairs of attributes and the values to set on them
+        """
+        pending = []
+
+        # Wrap in Vt arrays so USD can copy the data in bulk instead of converting
+        # each element
+        coords = Vt.Vec3fArray.FromNumpy(arrays.points)
+        # Normals are left out if they haven't changed since they were last written
+        normals = arrays.normals
+
+        if not arrays.has_faces:
+            # Only the shape of the mesh has changed, so only update points and normals
+            pending.append((attrs['points'], coords))
+            if normals is not None:
+                pending.append((attrs['normals'], vt_vec_array(normals, attrs['normals'].GetTypeName())))
+            return pending
+
+        newvertindices = Vt.IntArray.FromNumpy(arrays.face_vert_idx)
+        nface = Vt.IntArray.FromNumpy(arrays.face_counts)
+
+        if attrs is not None:
+            # omni.kit.commands.execute("DeletePrims", paths=[usd_mesh_path])
+            point_attr = attrs['points']
+            pending.append((point_attr, coords))
+
+            face_count = attrs['faceVertexCounts']
+            pending.append((face_count, nface))
+
+            face_idx = attrs['faceVertexIndices']
+            pending.append((face_idx, newvertindices))
+
+            if normals is not None:
+                normals_attr = attrs['normals']
+                pending.append((normals_attr, vt_vec_array(normals, normals_attr.GetTypeName())))
+
+            meshGeom = UsdGeom.Mesh(attrs['prim'])
+
+        # If it doesn't exist, make it. This will run the first time a human is created and
+        # whenever a new proxy is added
+        else:
+            # First determine if the mesh is a proxy
+            p = mesh.object.proxy
+            if p:
+                #  Determine if the mesh is a clothes proxy or a proxymesh. If not, then
+                #  an existing proxy of this type already exists, and we must overwrite it
+                type = p.type if p.type else "proxymeshes"
+                if not (type == "clothes" or type == "proxymeshes"):
+                    for child in self.prim.GetChildren():
+                        child_type = child.GetCustomDataByKey("Proxy_type:")
+                        if child_type == type:
+                            # If the child prim has the same type as the proxy, delete it
+                            omni.kit.commands.execute("DeletePrims", paths=[child.GetPath()])
+                            break
+
+            meshGeom = UsdGeom.Mesh.Define(stage, usd_mesh_path)
+
+            prim = meshGeom.GetPrim()
+
+            # Set vertices. This is a list of tuples for ALL vertices in an unassociated
+            # cloud. Faces are built based on indices of this list.
+            #   Example: 3 explicitly defined vertices:
+            #   meshGeom.CreatePointsAttr([(-10, 0, -10), (-10, 0, 10), (10, 0, 10)]
+            meshGeom.CreatePointsAttr(coords)
+
+            # Set face vertex count. This is an array where each element is the number
+            # of consecutive vertex indices to include in each face definition, as
+            # indices are given as a single flat list. The length of this list is the
+            # same as the number of faces
+            #   Example: 4 faces with 4 vertices each
+            #   meshGeom.CreateFaceVertexCountsAttr([4, 4, 4, 4])
+            meshGeom.CreateFaceVertexCountsAttr(nface)
+
+            # Set face vertex indices.
+            #   Example: one face with 4 vertices defined by 4 indices.
+            #   meshGeom.CreateFaceVertexIndicesAttr([0, 1, 2, 3])
+            meshGeom.CreateFaceVertexIndicesAttr(newvertindices)
+
+            # Set vertex normals. Normals are represented as a list of tuples each of
+            # which is a vector indicating the direction a point is facing. This is later
+            # Used to calculate face normals
+            #   Example: Normals for 3 vertices
+            # meshGeom.CreateNormalsAttr([(0, 1, 0), (0, 1, 0), (0, 1, 0), (0, 1,
+            # 0)])
+
+            if half_precision:
+                # The normals attribute only holds floats, so half precision normals are
+                # written to the normals primvar instead
+                normals_primvar = meshGeom.CreatePrimvar(
+                    "normals", Sdf.ValueTypeNames.Normal3hArray, UsdGeom.Tokens.vertex
+                )
+                normals_primvar.Set(vt_vec_array(normals, Sdf.ValueTypeNames.Normal3hArray))
             else:
-                # First determine if the mesh is a proxy
-                p = mesh.object.proxy
-                if p:
-                    #  Determine if the mesh is a clothes proxy or a proxymesh. If not, then
-                    #  an existing proxy of this type already exists, and we must overwrite it
-                    type = p.type if p.type else "proxymeshes"
-                    if not (type == "clothes" or type == "proxymeshes"):
-                        for child in self.prim.GetChildren():
-                            child_type = child.GetCustomDataByKey("Proxy_type:")
-                            if child_type == type:
-                                # If the child prim has the same type as the proxy, delete it
-                                omni.kit.commands.execute("DeletePrims", paths=[child.GetPath()])
-                                break
-
-                meshGeom = UsdGeom.Mesh.Define(stage, usd_mesh_path)
-
-                prim = meshGeom.GetPrim()
-
-                # Set vertices. This is a list of tuples for ALL vertices in an unassociated
-                # cloud. Faces are built based on indices of this list.
-                #   Example: 3 explicitly defined vertices:
-                #   meshGeom.CreatePointsAttr([(-10, 0, -10), (-10, 0, 10), (10, 0, 10)]
-                meshGeom.CreatePointsAttr(coords)
-
-                # Set face vertex count. This is an array where each element is the number
-                # of consecutive vertex indices to include in each face definition, as
-                # indices are given as a single flat list. The length of this list is the
-                # same as the number of faces
-                #   Example: 4 faces with 4 vertices each
-                #   meshGeom.CreateFaceVertexCountsAttr([4, 4, 4, 4])
-
-                nface = [nPerFace] * int(len(newvertindices) / nPerFace)
-                meshGeom.CreateFaceVertexCountsAttr(nface)
-
-                # Set face vertex indices.
-                #   Example: one face with 4 vertices defined by 4 indices.
-                #   meshGeom.CreateFaceVertexIndicesAttr([0, 1, 2, 3])
-                meshGeom.CreateFaceVertexIndicesAttr(newvertindices)
-
-                # Set vertex normals. Normals are represented as a list of tuples each of
-                # which is a vector indicating the direction a point is facing. This is later
-                # Used to calculate face normals
-                #   Example: Normals for 3 vertices
-                # meshGeom.CreateNormalsAttr([(0, 1, 0), (0, 1, 0), (0, 1, 0), (0, 1,
-                # 0)])
-
-                meshGeom.CreateNormalsAttr(mesh.getNormals())
+                meshGeom.CreateNormalsAttr(Vt.Vec3fArray.FromNumpy(normals))
                 meshGeom.SetNormalsInterpolation("vertex")
 
-                # If the mesh is a proxy, write the proxy path to the mesh prim
-                if mesh.object.proxy:
-                    p = mesh.object.proxy
-                    type = p.type if p.type else "proxymeshes"
-                    prim.SetCustomDataByKey("Proxy_path:", p.file)
-                    prim.SetCustomDataByKey("Proxy_type:", type)
-                    prim.SetCustomDataByKey("Proxy_name:", p.name)
-
-            # Set vertex uvs. UVs are represented as a list of tuples, each of which is a 2D
-            # coordinate. UV's are used to map textures to the surface of 3D geometry
-            #   Example: texture coordinates for 3 vertices
-            #   texCoords.Set([(0, 1), (0, 0), (1, 0)])
-
-            texCoords = meshGeom.CreatePrimvar(
-                "st", Sdf.ValueTypeNames.TexCoord2fArray, UsdGeom.Tokens.faceVarying
-            )
-            texCoords.Set(mesh.getUVs(newuvindices))
+            # If the mesh is a proxy, write the proxy path to the mesh prim
+            if mesh.object.proxy:
+                p = mesh.object.proxy
+                type = p.type if p.type else "proxymeshes"
+                prim.SetCustomDataByKey("Proxy_path:", p.file)
+                prim.SetCustomDataByKey("Proxy_type:", type)
+                prim.SetCustomDataByKey("Proxy_name:", p.name)
 
-            # # Subdivision is set to none. The mesh is as imported and not further refined
-            meshGeom.CreateSubdivisionSchemeAttr().Set("none")
+        # Set vertex uvs. UVs are represented as a list of tuples, each of which is a 2D
+        # coordinate. UV's are used to map textures to the surface of 3D geometry
+        #   Example: texture coordinates for 3 vertices
+        #   texCoords.Set([(0, 1), (0, 0), (1, 0)])
 
-        # ConvertPath strings to USD Sdf paths. TODO change to map() for performance
-        paths = [Sdf.Path(mesh_path) for mesh_path in usd_mesh_paths]
+        # The primvar is indexed, so the mesh's table of UVs is stored once along with the
+        # index of the UV used by each face corner, rather than a UV per face corner
+        uv_type = Sdf.ValueTypeNames.TexCoord2hArray if half_precision else Sdf.ValueTypeNames.TexCoord2fArray
+        texCoords = meshGeom.CreatePrimvar("st", uv_type, UsdGeom.Tokens.faceVarying)
+        # Match the type of the primvar, which may already exist with a different precision
+        pending.append((texCoords, vt_vec_array(arrays.uv_table, texCoords.GetTypeName())))
+        pending.append((texCoords.CreateIndicesAttr(), Vt.IntArray.FromNumpy(arrays.face_uv_idx)))
 
-        return paths
+        # # Subdivision is set to none. The mesh is as imported and not further refined
+        meshGeom.CreateSubdivisionSchemeAttr().Set("none")
+
+        return pending
+
+    def _topology_dirty(self, prim_path: str):
+        """Whether the faces of the human's meshes may have changed since they were last
+        imported under the given human prim.
+
+        Parameters
+        ----------
+        prim_path : str
+            Path to the human prim
+
+        Returns
+        -------
+        bool
+            True if faces and UVs must be rewritten to the stage
+        """
+        return self._topology_versions.get(prim_path) != MHCaller.topology_version
+
+    def _get_coords(self, mesh: Object3D):
+        """Gets the vertex coordinates of a makehuman mesh, reusing the cached array if
+        the mesh has not changed since it was last fetched.
+
+        Parameters
+        ----------
+        mesh : Object3D
+            Makehuman mesh
+
+        Returns
+        -------
+        np.ndarray
+            Array of vertex coordinates
+        """
+        return Human._cached(self._coords_cache, mesh, mesh.getCoords)
+
+    def _get_normals(self, mesh: Object3D):
+        """Gets the vertex normals of a makehuman mesh, reusing the cached array if
+        the mesh has not changed since it was last fetched.
+
+        Parameters
+        ----------
+        mesh : Object3D
+            Makehuman mesh
+
+        Returns
+        -------
+        np.ndarray
+            Array of vertex normals
+        """
+        return Human._cached(self._normals_cache, mesh, mesh.getNormals)
+
+    @staticmethod
+    def _cached(cache: dict, mesh: Object3D, fetch):
+        """Returns the array stored in the cache for the given mesh, or fetches and
+        stores it if the makehuman mesh or topology version or the vertex count has
+        changed. The topology version is included since a new mesh may reuse the id of
+        a removed one."""
+        key = id(mesh)
+        version = (MHCaller.mesh_version, MHCaller.topology_version, mesh.getVertexCount())
+        entry = cache.get(key)
+        if entry is None or entry[0] != version:
+            entry = (version, np.asarray(fetch()))
+            cache[key] = entry
+        return entry[1]
 
     def get_written_modifiers(self) -> Union[Dict[str, float], None]:
         """List of modifier names and values written to the human prim.
@@ -421,6 +830,7 @@ class Human:
         if value >= val_min and value <= val_max:
             # Set the value of the modifier
             modifier.setValue(value)
+            MHCaller.mark_modified()
             return True
         else:
             carb.log_warn(f"Value must be between {str(val_min)} and {str(val_max)}")
@@ -459,16 +869,30 @@ class Human:
 
         prim = stage.GetPrimAtPath(prim_path)
 
-        # Add custom data to the prim by key, designating the prim is a human
-        prim.SetCustomDataByKey("human", True)
-
-        # Get the modifiers of the human in mhcaller
-        modifiers = MHCaller.modifiers
-
-        for m in modifiers:
-            # Add the modifier to the prim as custom data by key. For modifiers,
-            # the format is "group/modifer:value"
-            prim.SetCustomDataByKey("Modifiers:" + m.fullName, m.getValue())
+        # Get the modifiers of the human in mhcaller as a dictionary in the format
+        # {"group/modifier": value}
+        modifiers = {m.fullName: m.getValue() for m in MHCaller.modifiers}
+
+        # Get the custom data already written to the prim
+        custom_data = prim.GetCustomData()
+        written = custom_data.get("Modifiers")
+
+        if custom_data.get("human") and written is not None:
+            # The prim is already a human, so only write the modifiers which have changed
+            changed = {name: value for name, value in modifiers.items() if written.get(name) != value}
+            removed = [name for name in written if name not in modifiers]
+
+            # Batch custom data writes into a single change notification
+            with Sdf.ChangeBlock():
+                for name, value in changed.items():
+                    prim.SetCustomDataByKey("Modifiers:" + name, value)
+                for name in removed:
+                    prim.ClearCustomDataByKey("Modifiers:" + name)
+        else:
+            # Designate the prim is a human and write all modifiers in a single call
+            custom_data["human"] = True
+            custom_data["Modifiers"] = modifiers
+            prim.SetCustomData(custom_data)
 
 
         # NOTE We are not currently using proxies in the USD export. Proxy data is stored
@@ -503,13 +927,29 @@ class Human:
 
         self.prim = usd_prim
 
+        # The prim may hold faces from a different session, so always rewrite them
+        self._topology_versions.pop(self.prim_path, None)
+
         # Get the data from the prim
         humandata = self.prim.GetCustomData()
 
         # Get the list of modifiers from the prim
         modifiers = humandata.get("Modifiers")
+        modifier_map = MHCaller.modifier_map
+        macros = []
         for m, v in modifiers.items():
-            MHCaller.human.getModifier(m).setValue(v, skipDependencies=False)
+            modifier = modifier_map[m]
+            if modifier.isMacro():
+                macros.append((modifier, v))
+            else:
+                # Set regular modifiers without updating dependencies. Targets are
+                # applied all at once below
+                modifier.setValue(v, skipDependencies=True)
+        # Only macros have dependent modifiers, so set them last to propagate their
+        # values to the modifiers which were already set
+        for modifier, v in macros:
+            modifier.setValue(v, skipDependencies=False)
+        MHCaller.mark_modified()
 
         # Gather proxies from the prim children
         proxies = []
@@ -574,12 +1014,10 @@ class Human:
 
             # Calculate vertex weights
             indices, weights = self.calculate_influences(mh_mesh, joint_names)
-            # Type conversion to native ints and floats from numpy
-            indices = list(map(int, indices))
-            weights = list(map(float, weights))
-            # Type conversion to USD
-            indices = Vt.IntArray(indices)
-            weights = Vt.FloatArray(weights)
+            # Type conversion to USD. Converting from numpy buffers directly avoids
+            # building lists of native ints and floats
+            indices = Vt.IntArray.FromNumpy(indices.astype(np.int32))
+            weights = Vt.FloatArray.FromNumpy(weights.astype(np.float32))
 
             # The number of weights to apply to each vertex, taken directly from
             # MakeHuman data
@@ -10,18 +10,13 @@ from pathlib import Path
 makehuman.set_sys_path()
 
 import human
-import animation
-import bvh
 import files3d
 import mh
 from core import G
 from mhmain import MHApplication
-from shared import wavefront
 import humanmodifier, skeleton
-import proxy, gui3d, events3d, targets
-from getpath import findFile
+import proxy
 import numpy as np
-import carb
 from .shared import data_path
 
 
@@ -48,10 +43,22 @@ class MHCaller:
     human : Human
         Makehuman Human object. Encapsulates all human data (parameters, available)
         modifiers, skeletons, meshes, assets, etc) and functions.
+    modifier_map : Dict[str, humanmodifier.Modifier]
+        All modifiers loaded for the human, keyed by full name
+    mesh_version : int
+        Counter incremented whenever the shape of the human may have changed
+        (modifiers, skeleton, pose). Used to invalidate cached mesh data and to
+        determine when normals must be rewritten to the stage.
+    topology_version : int
+        Counter incremented whenever the faces of the human's meshes may have
+        changed (proxies added or removed, human reset). Used to determine when
+        face data must be rewritten to the stage.
     """
 
     G = G
     human = None
+    mesh_version = 0
+    topology_version = 0
 
     def __init__(cls):
         """Constructs an instance of MHCaller. This involves setting up the
@@ -103,6 +110,21 @@ class MHCaller:
         # http://static.makehumancommunity.org/makehuman/docs/professional_mesh_topology.html
         cls.human.setAge(cls.human.getAge())
 
+        cls.mark_modified()
+        cls.mark_topology_modified()
+
+    @classmethod
+    def mark_modified(cls):
+        """Flags the human's mesh data as changed. Must be called after modifier values
+        are set so that cached coordinates and normals are not reused."""
+        cls.mesh_version += 1
+
+    @classmethod
+    def mark_topology_modified(cls):
+        """Flags the faces of the human's meshes as changed. Must be called whenever
+        proxies are added or removed. Does not affect the shape of existing meshes."""
+        cls.topology_version += 1
+
     @classmethod
     def init_human(cls):
         """Initialize the human and set some required files from disk. This
@@ -115,6 +137,9 @@ class MHCaller:
         # access it globally
         cls.G.app.selectedHuman = cls.human
         humanmodifier.loadModifiers(mh.getSysDataPath("modifiers/modeling_modifiers.json"), cls.human)
+        # Map modifier names to modifiers so they can be looked up without going through
+        # the human
+        cls.modifier_map = {m.fullName: m for m in cls.human.modifiers}
         # Add eyes
         # cls.add_proxy(data_path("eyes/high-poly/high-poly.mhpxy"), "eyes")
         cls.base_skel = skeleton.load(
@@ -228,6 +253,7 @@ class MHCaller:
         # TODO is this next line needed?
         mesh.setPickable(True)
         # TODO Can this next line be deleted? The app isn't running
+        import gui3d
         gui3d.app.addObject(obj)
 
         # Fit the proxy mesh to the human
@@ -260,6 +286,8 @@ class MHCaller:
         # Apply accumulated mask from previous layers on this proxy
         obj.changeVertexMask(proxyVertMask)
 
+        cls.mark_topology_modified()
+
         # Delete masked vertices
         # TODO add toggle for this feature in UI
         # verts = np.argwhere(pxy.deleteVerts)[..., 0]
@@ -294,6 +322,8 @@ class MHCaller:
             # Body proxies (musculature, etc)
             cls.human.setProxy(None)
 
+        cls.mark_topology_modified()
+
     @classmethod
     def clear_proxies(cls):
         """Removes all proxies from the human"""
@@ -348,6 +378,7 @@ class MHCaller:
         # Set the skeleton and update the human
         cls.human.setSkeleton(skel)
         cls.human.applyAllTargets()
+        cls.mark_modified()
 
         # Return the skeleton object
         return skel
@@ -376,6 +407,8 @@ class MHCaller:
     @classmethod
     def set_tpose(cls):
         """Sets the human to the T-Pose"""
+        # Only needed here, so imported on first use
+        import bvh
         # Load the T-Pose BVH file
         filepath = data_path('poses\\tpose.bvh')
         bvh_file = bvh.load(filepath, convertFromZUp="auto")
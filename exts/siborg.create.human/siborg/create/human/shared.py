@@ -1,8 +1,14 @@
 from pathlib import Path
+from dataclasses import dataclass
+import numpy as np
 import os
 
 # Shared methods that are useful to several modules
 
+# Translation table mapping characters which are illegal in prim names to underscores
+# TODO create more comprehensive list
+_SANITIZE_TABLE = str.maketrans({c: "_" for c in " /\\.-:()[]"})
+
 
 def data_path(path):
     """Returns the absolute path of a path given relative to "exts/<omni.ext>/data"
@@ -36,11 +42,44 @@ def sanitize(s: str):
     s : str
         Primpath-safe output string
     """
-    # List of illegal characters
-    # TODO create more comprehensive list
+    # Replace illegal characters with underscores in a single pass
     # TODO switch from blacklisting illegal characters to whitelisting valid ones
-    illegal = (".", "-")
-    for c in illegal:
-        # Replace illegal characters with underscores
-        s = s.replace(c, "_")
+    s = s.translate(_SANITIZE_TABLE)
+    # Prim names may not start with a digit
+    if s[:1].isdigit():
+        s = "_" + s
     return s
+
+
+@dataclass
+class MeshSoA:
+    """Struct-of-arrays view of a makehuman mesh, laid out the way USD stores meshes.
+    Arrays reference makehuman's data where possible rather than copying it.
+
+    Attributes
+    ----------
+    points : np.ndarray
+        Vertex coordinates, shape (nVerts, 3)
+    normals : np.ndarray, optional
+        Vertex normals, shape (nVerts, 3). None if normals are not needed. By default None
+    face_counts : np.ndarray, optional
+        Number of vertices in each face. None if faces are not needed. By default None
+    face_vert_idx : np.ndarray, optional
+        Flat array of vertex indices for each face. By default None
+    face_uv_idx : np.ndarray, optional
+        Flat array of indices into `uv_table` for each face corner. By default None
+    uv_table : np.ndarray, optional
+        Table of (u,v) coordinates, shape (nUVs, 2). By default None
+    """
+
+    points: np.ndarray
+    normals: np.ndarray = None
+    face_counts: np.ndarray = None
+    face_vert_idx: np.ndarray = None
+    face_uv_idx: np.ndarray = None
+    uv_table: np.ndarray = None
+
+    @property
+    def has_faces(self):
+        """Whether the face and UV arrays are set"""
+        return self.face_counts is not None